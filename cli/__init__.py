@@ -4,6 +4,7 @@ import os
 from pathlib import Path
 from .commands.create import ProjectCreator
 from .commands.version import list_versions, set_default_version
+from .commands.benchmark import run_benchmark
 
 @click.group()
 def cli():
@@ -27,6 +28,25 @@ def set_version(version):
     """Set the default Flaskify version to use."""
     set_default_version(version)
 
+@cli.command()
+@click.option('--version', 'template_version', default=None,
+              help='Template version to benchmark (defaults to the default version).')
+@click.option('--repeat', default=5, show_default=True,
+              help='Untraced runs per option combination; the median wall time is kept.')
+@click.option('--baseline', 'baseline_path', type=click.Path(exists=True, dir_okay=False),
+              help='Compare results against a stored baseline JSON file.')
+@click.option('--save-baseline', 'save_path', type=click.Path(dir_okay=False),
+              help='Store results as a baseline JSON file.')
+@click.option('--threshold', default=0.25, show_default=True,
+              help='Allowed relative increase over the baseline before failing.')
+@click.option('--min-delta', default=50.0, show_default=True,
+              help='Total wall time increases below this many milliseconds are ignored.')
+@click.option('--verbose', is_flag=True,
+              help='Also list combinations slower than the baseline (not gated).')
+def benchmark(template_version, repeat, baseline_path, save_path, threshold, min_delta, verbose):
+    """Benchmark project generation across all option combinations."""
+    run_benchmark(template_version, repeat, baseline_path, save_path, threshold, min_delta / 1000, verbose)
+
 @cli.command()
 def info():
     """Display information about Flaskify."""
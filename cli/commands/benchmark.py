@@ -0,0 +1,278 @@
+# cli/commands/benchmark.py
+import io
+import itertools
+import json
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from pathlib import Path
+from ..interactive.prompts import DATABASE_CHOICES, DEPLOYMENT_CHOICES, AUTH_TYPE_CHOICES
+from ..commands.create import ProjectCreator
+from ..commands.version import get_default_version
+from ..utils.helpers import error_exit, success_message, warning_message
+
+# Per-combination metrics gated against a stored baseline (higher is worse for all of them).
+# A single combination takes a few milliseconds, so its wall time is too noisy to gate on;
+# wall time is gated on the total across all combinations instead.
+GATED_METRICS = ('files_written', 'bytes_read', 'bytes_written', 'peak_memory')
+
+def get_option_combinations(version):
+    """
+    Build every combination of database, ML, auth, deployment and test options.
+    Swagger and async are left off so that only the benchmarked axes vary.
+    """
+    auth_choices = [(False, None)] + [(True, auth_type) for auth_type in AUTH_TYPE_CHOICES]
+
+    combinations = []
+    for database, use_ml, (add_auth, auth_type), deployment, add_tests in itertools.product(
+            DATABASE_CHOICES, [False, True], auth_choices, DEPLOYMENT_CHOICES, [False, True]):
+        options = {
+            'project_name': 'bench_project',
+            'version': version,
+            'database': database,
+            'use_ml': use_ml,
+            'deployment_target': deployment,
+            'add_authentication': add_auth,
+            'add_swagger': False,
+            'use_async': False,
+            'add_tests': add_tests,
+        }
+        if add_auth:
+            options['auth_type'] = auth_type
+        combinations.append(options)
+
+    return combinations
+
+def get_distinct_combinations(creator, version):
+    """
+    Collapse option combinations that resolve to the same template paths.
+    Options without a template in this version (e.g. deployment targets) add
+    nothing to generation, so only one combination per template set is measured.
+
+    Returns:
+        list: (options, labels) pairs, labels being every combination the options stand for
+    """
+    groups = {}
+    for options in get_option_combinations(version):
+        template_paths = tuple(creator.template_assembler.get_template_paths(options))
+        if template_paths not in groups:
+            groups[template_paths] = (options, [])
+        groups[template_paths][1].append(combination_key(options))
+
+    return list(groups.values())
+
+def combination_key(options):
+    """Get a stable identifier for an option combination."""
+    auth = options.get('auth_type', 'None') if options.get('add_authentication') else 'None'
+    return (f"db={options['database']},ml={options['use_ml']},auth={auth},"
+            f"deploy={options['deployment_target']},tests={options['add_tests']}")
+
+def _read_io_counters():
+    """Read the process I/O counters (Linux only). Returns (read, written) or None."""
+    try:
+        with open('/proc/self/io', 'r', encoding='utf-8') as f:
+            counters = dict(line.split(':', 1) for line in f if ':' in line)
+        return int(counters['rchar']), int(counters['wchar'])
+    except (OSError, KeyError, ValueError):
+        return None
+
+def measure_combination(creator, options, trace_memory=False):
+    """
+    Generate a project for one option combination in a temporary directory.
+    Only assembly, merge and customization run; venv, pip and git are skipped.
+    Peak memory is only measured when trace_memory is set, since tracing slows
+    every allocation and would skew the wall time.
+
+    Returns:
+        dict: wall_time (s), files_written, bytes_read, bytes_written, peak_memory (bytes or None)
+    """
+    work_dir = Path(tempfile.mkdtemp(prefix='flaskify-bench-'))
+    project_dir = work_dir / options['project_name']
+
+    try:
+        project_dir.mkdir()
+        output = io.StringIO()
+
+        if trace_memory:
+            tracemalloc.start()
+        io_before = _read_io_counters()
+        start_time = time.perf_counter()
+
+        with redirect_stdout(output):
+            creator.generate_project_files(project_dir, options)
+
+        wall_time = time.perf_counter() - start_time
+        io_after = _read_io_counters()
+        peak_memory = tracemalloc.get_traced_memory()[1] if trace_memory else None
+
+        files_written = sum(1 for path in project_dir.glob('**/*') if path.is_file())
+
+        if io_before is not None and io_after is not None:
+            bytes_read = io_after[0] - io_before[0]
+            bytes_written = io_after[1] - io_before[1]
+        else:
+            bytes_read = bytes_written = None
+
+        return {
+            'wall_time': wall_time,
+            'files_written': files_written,
+            'bytes_read': bytes_read,
+            'bytes_written': bytes_written,
+            'peak_memory': peak_memory,
+        }
+    finally:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def run_combinations(version, repeat=5):
+    """
+    Measure every distinct option combination, keyed by its first label.
+    Wall time is the median of untraced runs; peak memory comes from one extra traced run.
+    """
+    creator = ProjectCreator()
+    results = {}
+
+    for options, labels in get_distinct_combinations(creator, version):
+        runs = [measure_combination(creator, options) for _ in range(max(repeat, 1))]
+        traced = measure_combination(creator, options, trace_memory=True)
+
+        metrics = {
+            'wall_time': statistics.median(run['wall_time'] for run in runs),
+            'files_written': max(run['files_written'] for run in runs),
+            'peak_memory': traced['peak_memory'],
+        }
+        for metric in ('bytes_read', 'bytes_written'):
+            values = [run[metric] for run in runs if run[metric] is not None]
+            metrics[metric] = max(values) if values else None
+        metrics['combinations'] = labels
+
+        results[labels[0]] = metrics
+
+    return results
+
+def total_wall_time(results):
+    """Sum the wall time of all combinations."""
+    return sum(r['wall_time'] for r in results.values())
+
+def compare_to_baseline(results, baseline, threshold, min_delta=0.05):
+    """
+    Compare results against a baseline.
+
+    Args:
+        results (dict): Current results keyed by combination
+        baseline (dict): Baseline results keyed by combination
+        threshold (float): Allowed relative increase, e.g. 0.25 for 25%
+        min_delta (float): Total wall time increases below this (seconds) are ignored
+
+    Returns:
+        list: (combination, metric, baseline value, current value) for each regression
+    """
+    regressions = []
+
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+
+        for metric in GATED_METRICS:
+            old_value = previous.get(metric)
+            new_value = current.get(metric)
+            if not old_value or new_value is None:
+                continue
+            if new_value > old_value * (1 + threshold):
+                regressions.append((key, metric, old_value, new_value))
+
+    # Only combinations present in both runs count towards the total
+    common = [key for key in results if key in baseline]
+    old_total = sum(baseline[key]['wall_time'] for key in common)
+    new_total = sum(results[key]['wall_time'] for key in common)
+    if old_total and new_total - old_total > max(old_total * threshold, min_delta):
+        regressions.append(('total', 'wall_time', old_total, new_total))
+
+    return regressions
+
+def slower_combinations(results, baseline, threshold):
+    """List combinations whose wall time grew by more than threshold (informational only)."""
+    slower = []
+    for key, current in results.items():
+        old_value = baseline.get(key, {}).get('wall_time')
+        if old_value and current['wall_time'] > old_value * (1 + threshold):
+            slower.append((key, old_value, current['wall_time']))
+    return slower
+
+def load_baseline(baseline_path):
+    """Load stored benchmark results. Returns (version, results)."""
+    try:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        return baseline.get('version'), baseline.get('results', {})
+    except (OSError, ValueError) as e:
+        error_exit(f"Failed to read baseline {baseline_path}: {str(e)}")
+
+def save_baseline(baseline_path, version, results):
+    """Store benchmark results as a baseline."""
+    try:
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': version, 'results': results}, f, indent=2, sort_keys=True)
+        success_message(f"Baseline saved to {baseline_path}")
+    except OSError as e:
+        error_exit(f"Failed to save baseline {baseline_path}: {str(e)}")
+
+def _print_summary(results):
+    """Print totals and the slowest combinations."""
+    total_files = sum(r['files_written'] for r in results.values())
+    peak_memory = max(r['peak_memory'] for r in results.values())
+
+    covered = sum(len(r['combinations']) for r in results.values())
+    print(f"\nBenchmarked {len(results)} distinct template sets covering {covered} option combinations")
+    print(f"- Total wall time: {total_wall_time(results):.3f}s")
+    print(f"- Files written: {total_files}")
+    if all(r['bytes_read'] is not None for r in results.values()):
+        print(f"- Bytes read: {sum(r['bytes_read'] for r in results.values())}")
+        print(f"- Bytes written: {sum(r['bytes_written'] for r in results.values())}")
+    else:
+        warning_message("I/O counters are not available on this platform; bytes read/written not recorded.")
+    print(f"- Peak memory: {peak_memory / 1024:.1f} KiB")
+
+    print("\nSlowest combinations:")
+    slowest = sorted(results.items(), key=lambda item: item[1]['wall_time'], reverse=True)[:5]
+    for key, metrics in slowest:
+        print(f"  {metrics['wall_time'] * 1000:8.2f} ms  {key}")
+
+def run_benchmark(version=None, repeat=5, baseline_path=None, save_path=None, threshold=0.25,
+                  min_delta=0.05, verbose=False):
+    """Run the generator benchmark and optionally compare or save a baseline."""
+    if version is None:
+        version = get_default_version()
+
+    if baseline_path:
+        baseline_version, baseline = load_baseline(baseline_path)
+        if baseline_version != version:
+            error_exit(f"Baseline {baseline_path} was recorded for version {baseline_version}, "
+                       f"not {version}. Use --version {baseline_version} or record a new baseline.")
+
+    results = run_combinations(version, repeat)
+    _print_summary(results)
+
+    if save_path:
+        save_baseline(save_path, version, results)
+
+    if baseline_path:
+        slower = slower_combinations(results, baseline, threshold) if verbose else []
+        if slower:
+            print(f"\nCombinations slower by more than {threshold:.0%} (not gated):")
+            for key, old_value, new_value in slower:
+                print(f"  {key}: {old_value * 1000:.2f} ms -> {new_value * 1000:.2f} ms")
+
+        regressions = compare_to_baseline(results, baseline, threshold, min_delta)
+        if regressions:
+            print(f"\nRegressions above {threshold:.0%} threshold:")
+            for key, metric, old_value, new_value in regressions:
+                print(f"  {key}: {metric} {old_value} -> {new_value}")
+            error_exit(f"{len(regressions)} benchmark regression(s) found against {baseline_path}")
+
+        success_message(f"No regressions above {threshold:.0%} against {baseline_path}")
@@ -37,14 +37,8 @@ class ProjectCreator:
                 
             project_dir.mkdir(parents=True, exist_ok=False)
             
-            # Get template paths based on options
-            template_paths = self.template_assembler.get_template_paths(options)
-            
-            # Copy and merge template files
-            self.template_assembler.assemble_template(project_dir, template_paths)
-            
-            # Customize template based on options
-            self.template_assembler.customize_template(project_dir, options)
+            # Copy, merge and customize template files
+            self.generate_project_files(project_dir, options)
             
             # Set up virtual environment
             self._setup_venv(project_dir)
@@ -64,6 +58,17 @@ class ProjectCreator:
         except Exception as e:
             error_exit(f"Failed to create project: {str(e)}")
     
+    def generate_project_files(self, project_dir, options):
+        """Assemble, merge and customize the template files for the given options."""
+        # Get template paths based on options
+        template_paths = self.template_assembler.get_template_paths(options)
+        
+        # Copy and merge template files
+        self.template_assembler.assemble_template(project_dir, template_paths)
+        
+        # Customize template based on options
+        self.template_assembler.customize_template(project_dir, options)
+    
     def _setup_venv(self, project_dir):
         """Set up a virtual environment for the project."""
         try:
@@ -2,6 +2,10 @@
 import inquirer
 from ..commands.version import get_versions, get_default_version
 
+DATABASE_CHOICES = ['None', 'MongoDB', 'PostgreSQL', 'Firebase', 'Supabase']
+DEPLOYMENT_CHOICES = ['None', 'Docker', 'Heroku', 'AWS']
+AUTH_TYPE_CHOICES = ['JWT', 'OAuth2', 'Basic']
+
 def get_project_options():
     """
     Prompt the user for project configuration options.
@@ -21,19 +25,19 @@ def get_project_options():
                      default=default_version),
         inquirer.List('database',
                      message="Select a database integration:",
-                     choices=['None', 'MongoDB', 'PostgreSQL', 'Firebase', 'Supabase']),
+                     choices=DATABASE_CHOICES),
         inquirer.Confirm('use_ml',
                         message="Would you like to add ML model support?",
                         default=False),
         inquirer.List('deployment_target',
                      message="Select primary deployment target:",
-                     choices=['None', 'Docker', 'Heroku', 'AWS']),
+                     choices=DEPLOYMENT_CHOICES),
         inquirer.Confirm('add_authentication',
                         message="Would you like to add authentication support?",
                         default=True),
         inquirer.List('auth_type',
                      message="Select authentication type:",
-                     choices=['JWT', 'OAuth2', 'Basic'],
+                     choices=AUTH_TYPE_CHOICES,
                      default='JWT',
                      when=lambda answers: answers.get('add_authentication', False)),
         inquirer.Confirm('add_swagger',
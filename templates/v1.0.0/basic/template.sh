@@ -40,6 +40,8 @@ touch "app/api/v1/__init__.py"
 touch "app/api/v1/routes.py"
 touch "app/utils/__init__.py"
 touch "app/utils/helpers.py"
+touch "app/utils/responses.py"
+touch "app/utils/boot.py"
 touch "app/config/__init__.py"
 touch "app/config/config.py"
 touch ".env"
@@ -54,6 +56,8 @@ from flask import Flask
 from flask_restful import Api
 from flask_cors import CORS
 from app.config.config import Config
+from app.utils.responses import ResponsePipeline
+from app.utils.boot import register_boot_commands
 
 def create_app(config_class=Config):
     """Create and configure the Flask application."""
@@ -64,10 +68,16 @@ def create_app(config_class=Config):
     CORS(app)
     api = Api(app)
 
+    # Fast JSON encoding, gzip compression and ETags
+    ResponsePipeline(app)
+
     # Register blueprints/resources
     from app.api.v1 import bp as api_v1
     app.register_blueprint(api_v1, url_prefix='/api/v1')
 
+    # CLI: flask boot-report
+    register_boot_commands(app)
+
     @app.route('/')
     def index():
         """Root endpoint with API information."""
@@ -101,6 +111,16 @@ class Config:
     DEBUG = os.getenv('FLASK_DEBUG', 'False').lower() in ('true', '1', 't')
     TESTING = False
 
+    # Response encoding
+    JSON_PROVIDER = os.getenv('JSON_PROVIDER', 'orjson')  # orjson or stdlib
+    COMPRESS_ENABLED = os.getenv('COMPRESS_ENABLED', 'True').lower() in ('true', '1', 't')
+    COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 500))  # bytes
+    COMPRESS_LEVEL = int(os.getenv('COMPRESS_LEVEL', 6))
+    ETAG_ENABLED = os.getenv('ETAG_ENABLED', 'True').lower() in ('true', '1', 't')
+
+    # Worker boot budget in seconds (0 disables the check)
+    BOOT_TIME_BUDGET = float(os.getenv('BOOT_TIME_BUDGET', 0))
+
 class DevelopmentConfig(Config):
     """Development configuration."""
     DEBUG = True
@@ -128,8 +148,11 @@ cat > app/api/v1/__init__.py << EOF
 from flask import Blueprint
 from flask_restful import Api
 
+from app.utils.responses import output_json
+
 bp = Blueprint('api_v1', __name__)
 api = Api(bp)
+api.representation('application/json')(output_json)
 
 from app.api.v1 import routes
 EOF
@@ -225,6 +248,198 @@ def rate_limit(f):
     return decorated_function
 EOF
 
+# Create response pipeline (JSON provider, compression, ETags)
+cat > app/utils/responses.py << EOF
+import gzip
+import hashlib
+from flask import current_app, request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, falling back to the stdlib encoder."""
+
+    # Arguments passed by response() (jsonify, dict return values) that orjson can honour;
+    # orjson output is always compact and only supports two-space indentation
+    ORJSON_ARGS = ('indent', 'separators')
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string."""
+        if orjson is None or any(key not in self.ORJSON_ARGS for key in kwargs):
+            return super().dumps(obj, **kwargs)
+
+        # Send dates through self.default so they match the stdlib provider (RFC 822)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+        except TypeError:
+            # e.g. integers wider than 64 bits
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes."""
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+def output_json(data, code, headers=None):
+    """Flask-RESTful JSON representation using the app's JSON provider."""
+    response = current_app.response_class(
+        current_app.json.dumps(data) + "\\n",
+        status=code,
+        mimetype='application/json'
+    )
+    response.headers.extend(headers or {})
+    return response
+
+class ResponsePipeline:
+    """Installs the JSON provider and adds gzip compression and strong ETags."""
+
+    COMPRESSIBLE_MIMETYPES = (
+        'application/json', 'text/html', 'text/plain', 'text/css',
+        'text/javascript', 'application/javascript'
+    )
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Initialize with Flask app."""
+        app.config.setdefault('JSON_PROVIDER', 'orjson')
+        app.config.setdefault('COMPRESS_ENABLED', True)
+        app.config.setdefault('COMPRESS_MIN_SIZE', 500)
+        app.config.setdefault('COMPRESS_LEVEL', 6)
+        app.config.setdefault('ETAG_ENABLED', True)
+
+        if app.config['JSON_PROVIDER'] == 'orjson':
+            if orjson is None:
+                app.logger.warning("orjson is not installed, using the stdlib JSON provider")
+            else:
+                app.json = OrjsonProvider(app)
+
+        app.after_request(self.process_response)
+
+    def process_response(self, response):
+        """Answer conditional GETs with 304 and compress large bodies."""
+        if (response.status_code != 200 or response.direct_passthrough
+                or response.is_streamed or 'Content-Encoding' in response.headers):
+            return response
+
+        config = current_app.config
+        data = response.get_data()
+
+        compressible = (
+            config['COMPRESS_ENABLED']
+            and response.mimetype in self.COMPRESSIBLE_MIMETYPES
+            and len(data) >= config['COMPRESS_MIN_SIZE']
+        )
+        if compressible:
+            response.vary.add('Accept-Encoding')
+        compress = compressible and request.accept_encodings['gzip'] > 0
+
+        if config['ETAG_ENABLED'] and request.method in ('GET', 'HEAD') and 'ETag' not in response.headers:
+            # Hash the uncompressed body so a matching 304 never pays for compression
+            etag = hashlib.sha1(data).hexdigest()
+            if compress:
+                etag += '-gzip'
+            response.set_etag(etag)
+            response = response.make_conditional(request)
+            if response.status_code == 304:
+                return response
+
+        if compress:
+            response.set_data(gzip.compress(data, compresslevel=config['COMPRESS_LEVEL']))
+            response.headers['Content-Encoding'] = 'gzip'
+
+        return response
+EOF
+
+# Create boot time report
+cat > app/utils/boot.py << EOF
+import os
+import subprocess
+import sys
+import click
+
+# Runs in a fresh interpreter so nothing is already imported
+BOOT_SNIPPET = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "from app import create_app\n"
+    "from app.config.config import config\n"
+    "create_app(config[{env!r}])\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+def import_time_report(env='production', top=15):
+    """
+    Boot the app in a subprocess with -X importtime.
+    Work create_app hands to background threads (e.g. MongoDB index creation) is not measured.
+
+    Returns:
+        dict: boot_time (s) and the slowest packages as
+              (package, cumulative seconds) pairs
+    """
+    project_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', BOOT_SNIPPET.format(env=env)],
+        cwd=project_dir, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"App failed to boot: {result.stderr.strip().splitlines()[-1]}")
+
+    # The first (outermost) import of a package has the largest cumulative time
+    packages = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        package = name.strip().split('.')[0]
+        # The app package itself is the whole boot
+        if package == 'app':
+            continue
+        packages[package] = max(packages.get(package, 0), int(cumulative) / 1e6)
+
+    imports = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    return {
+        'boot_time': float(result.stdout.strip().splitlines()[-1]),
+        'imports': imports[:top]
+    }
+
+def register_boot_commands(app):
+    """Register the boot-report CLI command."""
+    @app.cli.command('boot-report')
+    @click.option('--env', default='production', help='Configuration to boot with.')
+    @click.option('--top', default=15, help='Number of packages to show.')
+    @click.option('--budget', type=float, default=None,
+                  help='Fail if boot takes longer (seconds). Defaults to BOOT_TIME_BUDGET.')
+    def boot_report(env, top, budget):
+        """Show what a cold worker boot spends its time importing."""
+        report = import_time_report(env, top)
+
+        click.echo(f"Boot time: {report['boot_time']:.3f}s")
+        click.echo("Slowest packages (cumulative import time):")
+        for name, seconds in report['imports']:
+            click.echo(f"  {seconds * 1000:9.1f} ms  {name}")
+
+        if budget is None:
+            budget = app.config.get('BOOT_TIME_BUDGET', 0)
+        if budget and report['boot_time'] > budget:
+            raise click.ClickException(
+                f"Boot time {report['boot_time']:.3f}s exceeds budget of {budget:.3f}s"
+            )
+EOF
+
 # Create run.py
 cat > run.py << EOF
 import os
@@ -299,6 +514,16 @@ API_VERSION=v1
 RATE_LIMIT=1000
 RATE_LIMIT_PERIOD=15
 
+# Response Encoding
+JSON_PROVIDER=orjson
+COMPRESS_ENABLED=True
+COMPRESS_MIN_SIZE=500
+COMPRESS_LEVEL=6
+ETAG_ENABLED=True
+
+# Worker boot budget in seconds, checked by 'flask boot-report' (0 disables)
+BOOT_TIME_BUDGET=0
+
 # Security
 SECRET_KEY=$(python3 -c "import secrets; print(secrets.token_hex(32))")
 EOF
@@ -315,6 +540,7 @@ A Flask API project created with Flaskify.
 - 🔒 Built-in rate limiting
 - 🌐 CORS enabled
 - 📝 Clear project structure
+- ⚡ Fast JSON encoding with gzip compression and ETags
 
 ## Quick Start
 
@@ -334,6 +560,20 @@ A Flask API project created with Flaskify.
    python run.py
    \`\`\`
 
+## Startup Time
+
+Heavy libraries (numpy, joblib, scikit-learn, pymongo, bson) are imported inside the functions that
+use them rather than at module level, so a worker only pays for them on the first request that needs
+them. Keep new imports of heavy libraries local in the same way. SQLAlchemy and the route modules are
+still imported at boot: models subclass \`db.Model\` when they are defined, and Flask only accepts
+routes registered before the first request.
+
+To see what a cold worker boot spends its time importing, and fail when it exceeds \`BOOT_TIME_BUDGET\`:
+
+\`\`\`
+flask boot-report --budget 1.5
+\`\`\`
+
 Your API will be available at: http://localhost:5000
 EOF
 
@@ -343,6 +583,7 @@ Flask==3.0.0
 Flask-RESTful==0.3.10
 Flask-CORS==4.0.0
 python-dotenv==1.0.0
+orjson==3.9.10
 requests==2.31.0
 pytest==7.4.3
 EOF
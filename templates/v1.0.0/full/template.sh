@@ -109,9 +109,17 @@ from flask import current_app
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
 import uuid
+from app.models.mongo_model import register_model
 
+@register_model
 class MongoUser:
     """MongoDB user model for JWT authentication."""
+
+    collection_name = 'users'
+    indexes = [
+        {'keys': [('username', 1)], 'unique': True},
+        {'keys': [('email', 1)], 'unique': True},
+    ]
     
     @classmethod
     def create_user(cls, username, email, password, role='user'):
@@ -124,23 +132,23 @@ class MongoUser:
             'created_at': datetime.utcnow().isoformat()
         }
         
-        user_id = current_app.mongo.insert_one('users', user)
+        user_id = current_app.mongo.insert_one(cls.collection_name, user)
         return user_id
     
     @classmethod
     def get_by_id(cls, user_id):
         """Get a user by ID."""
-        return current_app.mongo.find_one('users', {'_id': user_id})
+        return current_app.mongo.find_one(cls.collection_name, {'_id': user_id})
     
     @classmethod
     def get_by_username(cls, username):
         """Get a user by username."""
-        return current_app.mongo.find_one('users', {'username': username})
+        return current_app.mongo.find_one(cls.collection_name, {'username': username})
     
     @classmethod
     def get_by_email(cls, email):
         """Get a user by email."""
-        return current_app.mongo.find_one('users', {'email': email})
+        return current_app.mongo.find_one(cls.collection_name, {'email': email})
     
     @staticmethod
     def check_password(user, password):
@@ -150,12 +158,12 @@ class MongoUser:
     @classmethod
     def update_user(cls, user_id, update_data):
         """Update a user."""
-        return current_app.mongo.update_one('users', {'_id': user_id}, update_data)
+        return current_app.mongo.update_one(cls.collection_name, {'_id': user_id}, update_data)
     
     @classmethod
     def delete_user(cls, user_id):
         """Delete a user."""
-        return current_app.mongo.delete_one('users', {'_id': user_id})
+        return current_app.mongo.delete_one(cls.collection_name, {'_id': user_id})
 EOF
 
 # Enhance auth routes to support both DB types
@@ -927,7 +935,6 @@ cat > app/api/docs.py << EOF
 from flask import Blueprint, render_template, current_app
 import os
 import json
-import markdown
 import re
 from flask_restful import Resource
 
@@ -16,8 +16,6 @@ touch "app/services/__init__.py"
 cat > app/services/ml_service.py << EOF
 import os
 import pickle
-import numpy as np
-import joblib
 from flask import current_app
 import time
 from pathlib import Path
@@ -74,6 +72,7 @@ class MLService:
                     with open(model_path, 'rb') as f:
                         model = pickle.load(f)
                 else:  # .joblib
+                    import joblib
                     model = joblib.load(model_path)
                 
                 load_time = time.time() - start_time
@@ -86,6 +85,8 @@ class MLService:
     
     def predict(self, model_name, data):
         """Make a prediction using a model."""
+        import numpy as np
+
         # Load model if not already loaded
         if model_name not in self.models:
             self.load_model(model_name)
@@ -179,9 +180,7 @@ from flask import request, current_app, jsonify
 from flask_restful import Resource
 from app.api.v1 import api
 from app.utils.helpers import rate_limit
-import numpy as np
 import os
-from app.models.ml.example_model import ExampleModel
 
 class ModelList(Resource):
     @rate_limit
@@ -234,6 +233,8 @@ class CreateExampleModel(Resource):
     def post(self):
         """Create an example linear regression model."""
         try:
+            from app.models.ml.example_model import ExampleModel
+
             model_dir = current_app.config.get('ML_MODEL_DIR', 'models')
             os.makedirs(model_dir, exist_ok=True)
             
@@ -295,7 +296,7 @@ cat > .env.merge << EOF
   "operations": [
     {
       "type": "append",
-      "content": "\n# ML Configuration\nML_MODEL_DIR=models\nML_PRELOAD_MODELS=True\n"
+      "content": "\n# ML Configuration\nML_MODEL_DIR=models\nML_PRELOAD_MODELS=False\n"
     }
   ]
 }
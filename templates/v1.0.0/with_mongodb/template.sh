@@ -12,93 +12,259 @@ touch "app/models/__init__.py"
 # Create MongoDB model file
 cat > app/models/mongo_model.py << EOF
 from flask import current_app
-from pymongo import MongoClient
-from bson.objectid import ObjectId
 import os
+import threading
+import time
+
+# Models whose declared indexes are created by MongoDB.ensure_indexes
+registered_models = []
+
+def register_model(model):
+    """
+    Class decorator registering a model's declared indexes.
+
+    The model sets collection_name and indexes. Each index is a dict with
+    'keys' (a list of (field, direction) pairs) plus any create_index options,
+    e.g. {'keys': [('email', 1)], 'unique': True}.
+    """
+    registered_models.append(model)
+    return model
 
 class MongoDB:
     """MongoDB connection and operations class."""
-    
+
     def __init__(self, app=None):
-        self.client = None
-        self.db = None
-        
+        self.mongo_uri = None
+        self.db_name = None
+        self._client = None
+        self._db = None
+        self.logger = None
+        self.slow_query_ms = 0
+        self.index_background = True
+        self._indexes_ensured = False
+        self._index_lock = threading.Lock()
+        self._client_lock = threading.Lock()
+        self._explained_queries = set()
+
         if app is not None:
             self.init_app(app)
-    
+
     def init_app(self, app):
         """Initialize MongoDB with the Flask app."""
         mongo_uri = app.config.get('MONGO_URI')
         db_name = app.config.get('MONGO_DB_NAME')
-        
+
         if not mongo_uri or not db_name:
             raise ValueError("MONGO_URI and MONGO_DB_NAME must be set in the Flask app config")
-        
-        self.client = MongoClient(mongo_uri)
-        self.db = self.client[db_name]
-        
+
+        self.mongo_uri = mongo_uri
+        self.db_name = db_name
+        self.logger = app.logger
+        self.slow_query_ms = app.config.get('MONGO_SLOW_QUERY_MS', 100)
+        self.index_background = app.config.get('MONGO_INDEX_BACKGROUND', True)
+
         # Add MongoDB instance to app
+        # The client is kept for the life of the worker; MongoClient pools connections itself
         app.mongo = self
-        
-        # Register close function
-        @app.teardown_appcontext
-        def close_mongo_connection(exception):
-            if self.client:
-                self.client.close()
-    
+
+    @property
+    def client(self):
+        """Get the MongoClient, creating it on first access."""
+        if self._client is None:
+            if not self.mongo_uri:
+                raise RuntimeError("MongoDB not initialized. Call init_app first.")
+            from pymongo import MongoClient
+
+            # The index thread and request threads may get here at the same time
+            with self._client_lock:
+                if self._client is None:
+                    self._client = MongoClient(self.mongo_uri)
+        return self._client
+
+    @property
+    def db(self):
+        """Get the configured database."""
+        if self._db is None:
+            self._db = self.client[self.db_name]
+        return self._db
+
     def get_collection(self, collection_name):
         """Get a MongoDB collection."""
-        if not self.db:
-            raise RuntimeError("MongoDB not initialized. Call init_app first.")
         return self.db[collection_name]
-    
+
+    def ensure_indexes(self, background=None):
+        """
+        Create the indexes declared by registered models.
+        Safe to call repeatedly; runs in a daemon thread unless background is False.
+        """
+        # Nothing to do: don't start a thread, import pymongo or connect
+        if not registered_models or self._indexes_ensured:
+            return None
+
+        if background is None:
+            background = self.index_background
+
+        if background:
+            thread = threading.Thread(target=self._create_indexes, name='mongo-ensure-indexes', daemon=True)
+            thread.start()
+            return thread
+
+        self._create_indexes()
+        return None
+
+    def _create_indexes(self):
+        """Create declared indexes once per process; retried on the next call if any fail."""
+        from pymongo import IndexModel
+        from pymongo.errors import PyMongoError
+
+        with self._index_lock:
+            if self._indexes_ensured:
+                return
+
+            failed = False
+            for model in registered_models:
+                indexes = [
+                    IndexModel(index['keys'], **{k: v for k, v in index.items() if k != 'keys'})
+                    for index in model.indexes
+                ]
+                try:
+                    # createIndexes is a no-op for indexes that already exist
+                    names = self.get_collection(model.collection_name).create_indexes(indexes)
+                    self.logger.info(f"Ensured indexes on '{model.collection_name}': {', '.join(names)}")
+                except PyMongoError as e:
+                    self.logger.warning(f"Failed to create indexes on '{model.collection_name}': {e}")
+                    failed = True
+
+            self._indexes_ensured = not failed
+
+    def _check_slow_query(self, collection, query, duration, sort=None, skip=0, limit=0):
+        """Log queries slower than MONGO_SLOW_QUERY_MS and explain whether they scan the collection."""
+        if not self.slow_query_ms or duration * 1000 < self.slow_query_ms:
+            return
+
+        # Log field names only; query values may hold personal data
+        shape = self._query_shape(query)
+        sort = self._sort_spec(sort)
+        self.logger.warning(
+            f"Slow MongoDB query on '{collection.name}' took {duration * 1000:.1f}ms: "
+            f"filter={shape} sort={sort}"
+        )
+
+        # Explain each query shape once per process
+        key = (collection.name, repr(shape), repr(sort))
+        if key in self._explained_queries:
+            return
+
+        command = {'find': collection.name, 'filter': query}
+        if sort:
+            command['sort'] = sort
+        if skip:
+            command['skip'] = skip
+        if limit:
+            command['limit'] = limit
+
+        try:
+            # queryPlanner verbosity only plans the query, it doesn't run it again
+            explain = self.db.command('explain', command, verbosity='queryPlanner')
+            stages = self._plan_stages(explain['queryPlanner']['winningPlan'])
+        except Exception as e:
+            # Not recorded as explained, so a transient failure is retried next time
+            self.logger.debug(f"Could not explain query on '{collection.name}': {e}")
+            return
+
+        self._explained_queries.add(key)
+        if 'COLLSCAN' in stages:
+            self.logger.warning(
+                f"MongoDB query on '{collection.name}' used a collection scan, consider an index: "
+                f"filter={shape} sort={sort}"
+            )
+
+    @classmethod
+    def _query_shape(cls, value):
+        """Replace the values in a query with '?', keeping field names and operators."""
+        if isinstance(value, dict):
+            return {key: cls._query_shape(item) for key, item in value.items()}
+        # \$and / \$or / \$nor hold lists of sub-queries
+        if isinstance(value, (list, tuple)) and value and all(isinstance(item, dict) for item in value):
+            return [cls._query_shape(item) for item in value]
+        return '?'
+
+    @staticmethod
+    def _sort_spec(sort):
+        """Convert a cursor sort argument to the dict used by the find command."""
+        if not sort:
+            return None
+        if isinstance(sort, str):
+            return {sort: 1}
+        return dict(sort)
+
+    @classmethod
+    def _plan_stages(cls, plan):
+        """List the stages of a query plan."""
+        # Slot-based engine plans nest the classic plan under queryPlan
+        plan = plan.get('queryPlan', plan)
+        stages = [plan.get('stage')]
+        for child in [plan.get('inputStage')] + plan.get('inputStages', []):
+            if child:
+                stages.extend(cls._plan_stages(child))
+        return stages
+
+    def _convert_id(self, query):
+        """Convert a string _id in a query to an ObjectId."""
+        if '_id' in query and isinstance(query['_id'], str):
+            from bson.objectid import ObjectId
+            query['_id'] = ObjectId(query['_id'])
+        return query
+
     def insert_one(self, collection_name, document):
         """Insert a document into a collection."""
         collection = self.get_collection(collection_name)
         result = collection.insert_one(document)
         return str(result.inserted_id)
-    
+
     def find_one(self, collection_name, query):
         """Find a document in a collection."""
         collection = self.get_collection(collection_name)
-        if '_id' in query and isinstance(query['_id'], str):
-            query['_id'] = ObjectId(query['_id'])
+        query = self._convert_id(query)
+
+        start_time = time.perf_counter()
         document = collection.find_one(query)
+        self._check_slow_query(collection, query, time.perf_counter() - start_time)
+
         return document
-    
+
     def find(self, collection_name, query=None, limit=0, skip=0, sort=None):
         """Find documents in a collection."""
         collection = self.get_collection(collection_name)
         if query is None:
             query = {}
-        if '_id' in query and isinstance(query['_id'], str):
-            query['_id'] = ObjectId(query['_id'])
-        
+
+        query = self._convert_id(query)
         cursor = collection.find(query)
-        
+
         if skip:
             cursor = cursor.skip(skip)
         if limit:
             cursor = cursor.limit(limit)
         if sort:
             cursor = cursor.sort(sort)
-        
-        return list(cursor)
-    
+
+        start_time = time.perf_counter()
+        documents = list(cursor)
+        self._check_slow_query(collection, query, time.perf_counter() - start_time, sort, skip, limit)
+
+        return documents
+
     def update_one(self, collection_name, query, update):
         """Update a document in a collection."""
         collection = self.get_collection(collection_name)
-        if '_id' in query and isinstance(query['_id'], str):
-            query['_id'] = ObjectId(query['_id'])
-        result = collection.update_one(query, {'$set': update})
+        result = collection.update_one(self._convert_id(query), {'\$set': update})
         return result.modified_count
-    
+
     def delete_one(self, collection_name, query):
         """Delete a document from a collection."""
         collection = self.get_collection(collection_name)
-        if '_id' in query and isinstance(query['_id'], str):
-            query['_id'] = ObjectId(query['_id'])
-        result = collection.delete_one(query)
+        result = collection.delete_one(self._convert_id(query))
         return result.deleted_count
 EOF
 
@@ -115,6 +281,11 @@ cat > app/__init__.py.merge << EOF
       "type": "replace",
       "target": "# Initialize extensions\n    CORS(app)",
       "content": "# Initialize extensions\n    CORS(app)\n    mongo = MongoDB(app)"
+    },
+    {
+      "type": "replace",
+      "target": "app.register_blueprint(api_v1, url_prefix='/api/v1')",
+      "content": "app.register_blueprint(api_v1, url_prefix='/api/v1')\n\n    # Create indexes declared by Mongo models (models are imported with the routes)\n    mongo.ensure_indexes()"
     }
   ]
 }
@@ -127,7 +298,7 @@ cat > app/config/config.py.merge << EOF
     {
       "type": "replace",
       "target": "class Config:",
-      "content": "class Config:\n    # MongoDB Configuration\n    MONGO_URI = os.getenv('MONGO_URI', 'mongodb://localhost:27017')\n    MONGO_DB_NAME = os.getenv('MONGO_DB_NAME', '{{ PROJECT_NAME }}')"
+      "content": "class Config:\n    # MongoDB Configuration\n    MONGO_URI = os.getenv('MONGO_URI', 'mongodb://localhost:27017')\n    MONGO_DB_NAME = os.getenv('MONGO_DB_NAME', '{{ PROJECT_NAME }}')\n    MONGO_INDEX_BACKGROUND = os.getenv('MONGO_INDEX_BACKGROUND', 'True').lower() in ('true', '1', 't')\n    MONGO_SLOW_QUERY_MS = int(os.getenv('MONGO_SLOW_QUERY_MS', 100))  # 0 disables"
     }
   ]
 }
@@ -139,7 +310,7 @@ cat > .env.merge << EOF
   "operations": [
     {
       "type": "append",
-      "content": "\n# MongoDB Configuration\nMONGO_URI=mongodb://localhost:27017\nMONGO_DB_NAME={{ PROJECT_NAME }}\n"
+      "content": "\n# MongoDB Configuration\nMONGO_URI=mongodb://localhost:27017\nMONGO_DB_NAME={{ PROJECT_NAME }}\nMONGO_INDEX_BACKGROUND=True\nMONGO_SLOW_QUERY_MS=100\n"
     }
   ]
 }
@@ -164,14 +335,14 @@ from flask_restful import Resource
 from app.api.v1 import api
 from app.utils.helpers import rate_limit
 from flask import current_app
-from bson.json_util import dumps
 import json
-from bson.objectid import ObjectId
 
 class MongoDBCollection(Resource):
     @rate_limit
     def get(self, collection_name):
         """Get all documents from a collection."""
+        from bson.json_util import dumps
+
         try:
             # Get query parameters
             limit = int(request.args.get('limit', 100))
@@ -214,6 +385,9 @@ class MongoDBDocument(Resource):
     @rate_limit
     def get(self, collection_name, document_id):
         """Get a specific document from a collection."""
+        from bson.json_util import dumps
+        from bson.objectid import ObjectId
+
         try:
             # Find document
             document = current_app.mongo.find_one(collection_name, {'_id': ObjectId(document_id)})
@@ -232,6 +406,8 @@ class MongoDBDocument(Resource):
     @rate_limit
     def put(self, collection_name, document_id):
         """Update a specific document in a collection."""
+        from bson.objectid import ObjectId
+
         try:
             data = request.get_json()
             if not data:
@@ -251,6 +427,8 @@ class MongoDBDocument(Resource):
     @rate_limit
     def delete(self, collection_name, document_id):
         """Delete a specific document from a collection."""
+        from bson.objectid import ObjectId
+
         try:
             # Delete document
             deleted = current_app.mongo.delete_one(collection_name, {'_id': ObjectId(document_id)})
@@ -291,7 +469,7 @@ cat > README.md.merge << EOF
     },
     {
       "type": "append",
-      "content": "\n## MongoDB Integration\n\nThis API includes MongoDB integration with the following endpoints:\n\n- `GET /api/v1/db/<collection>`: Get all documents from a collection\n- `POST /api/v1/db/<collection>`: Create a new document in a collection\n- `GET /api/v1/db/<collection>/<id>`: Get a specific document\n- `PUT /api/v1/db/<collection>/<id>`: Update a specific document\n- `DELETE /api/v1/db/<collection>/<id>`: Delete a specific document\n\nConfigure MongoDB connection in the `.env` file.\n"
+      "content": "\n## MongoDB Integration\n\nThis API includes MongoDB integration with the following endpoints:\n\n- \`GET /api/v1/db/<collection>\`: Get all documents from a collection\n- \`POST /api/v1/db/<collection>\`: Create a new document in a collection\n- \`GET /api/v1/db/<collection>/<id>\`: Get a specific document\n- \`PUT /api/v1/db/<collection>/<id>\`: Update a specific document\n- \`DELETE /api/v1/db/<collection>/<id>\`: Delete a specific document\n\nConfigure MongoDB connection in the \`.env\` file.\n\nModels declare their indexes with \`collection_name\`, \`indexes\` and the \`@register_model\` decorator from \`app/models/mongo_model.py\`; they are created in the background at startup, after the boot time measured by \`flask boot-report\`. Queries slower than \`MONGO_SLOW_QUERY_MS\` are logged by field names only, and each query shape is explained once to warn when it scans the whole collection.\n"
     }
   ]
 }
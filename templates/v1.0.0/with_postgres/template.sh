@@ -15,11 +15,20 @@ cat > app/models/postgres_model.py << EOF
 from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.exc import SQLAlchemyError
+import click
 import os
 
 # Initialize SQLAlchemy
 db = SQLAlchemy()
 
+def register_db_commands(app):
+    """Register the create-db CLI command."""
+    @app.cli.command('create-db')
+    def create_db():
+        """Create database tables that don't exist yet."""
+        db.create_all()
+        click.echo("Database tables created")
+
 class Base:
     """Base model class with common operations."""
     
@@ -93,12 +102,12 @@ cat > app/__init__.py.merge << EOF
     {
       "type": "replace",
       "target": "from flask import Flask",
-      "content": "from flask import Flask\nfrom app.models.postgres_model import db"
+      "content": "from flask import Flask\nfrom app.models.postgres_model import db, register_db_commands"
     },
     {
       "type": "replace",
       "target": "# Initialize extensions\n    CORS(app)",
-      "content": "# Initialize extensions\n    CORS(app)\n    db.init_app(app)\n    \n    # Create database tables if they don't exist\n    with app.app_context():\n        db.create_all()"
+      "content": "# Initialize extensions\n    CORS(app)\n    db.init_app(app)\n    \n    # Tables are created by 'flask create-db' or Alembic, not on every worker boot\n    register_db_commands(app)"
     }
   ]
 }
@@ -471,7 +480,7 @@ cat > README.md.merge << EOF
     },
     {
       "type": "append",
-      "content": "\n## PostgreSQL Integration\n\nThis API includes PostgreSQL integration with the following endpoints:\n\n- `GET /api/v1/users`: Get all users\n- `POST /api/v1/users`: Create a new user\n- `GET /api/v1/users/<id>`: Get a specific user\n- `PUT /api/v1/users/<id>`: Update a specific user\n- `DELETE /api/v1/users/<id>`: Delete a specific user\n\nDatabase migration is handled using Alembic:\n\n```bash\n# Create a new migration\npython -m alembic revision --autogenerate -m \"Description\"\n\n# Run migrations\npython -m alembic upgrade head\n```\n\nConfigure PostgreSQL connection in the `.env` file.\n"
+      "content": "\n## PostgreSQL Integration\n\nThis API includes PostgreSQL integration with the following endpoints:\n\n- \`GET /api/v1/users\`: Get all users\n- \`POST /api/v1/users\`: Create a new user\n- \`GET /api/v1/users/<id>\`: Get a specific user\n- \`PUT /api/v1/users/<id>\`: Update a specific user\n- \`DELETE /api/v1/users/<id>\`: Delete a specific user\n\nCreate the tables for a new database:\n\n\`\`\`bash\nflask create-db\n\`\`\`\n\nDatabase migration is handled using Alembic:\n\n\`\`\`bash\n# Create a new migration\npython -m alembic revision --autogenerate -m \"Description\"\n\n# Run migrations\npython -m alembic upgrade head\n\`\`\`\n\nConfigure PostgreSQL connection in the \`.env\` file.\n"
     }
   ]
 }